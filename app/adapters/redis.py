@@ -3,17 +3,31 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from collections.abc import Coroutine
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Self
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from app.utilities import logging
 
-type PubSubHandler = Callable[[str], Coroutine[None, None, None]]
+# Handlers receive bytes by default, or str when `decode_responses` is enabled.
+type PubSubHandler = (
+    Callable[[bytes], Coroutine[None, None, None]]
+    | Callable[[str], Coroutine[None, None, None]]
+)
+type RedisPipeline = Pipeline
 
 logger = logging.get_logger(__name__)
 
-_TASK_QUEUE_SIZE = 100
+
+# Channels arrive as bytes unless `decode_responses` is set. JSON logging would
+# base64-encode them, so they are decoded before being logged.
+def _channel_name(channel: bytes | str) -> str:
+    if isinstance(channel, bytes):
+        return channel.decode()
+    return channel
 
 
 class RedisClient(Redis):
@@ -25,18 +39,20 @@ class RedisClient(Redis):
         port: int,
         database: int = 0,
         password: str | None = None,
+        *,
+        decode_responses: bool = False,
     ) -> None:
         super().__init__(
             host=host,
             port=port,
             db=database,
             password=password,
-            decode_responses=True,
+            decode_responses=decode_responses,
         )
 
+        self._decode_responses = decode_responses
         self._pubsub_router = RedisPubsubRouter()
-        self._tasks: asyncio.Queue[asyncio.Task[None]] = asyncio.Queue(_TASK_QUEUE_SIZE)
-        self._pubsub_listen_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
         self._pubsub_task: asyncio.Task[None] | None = None
 
     async def initialise(self) -> Self:
@@ -46,6 +62,7 @@ class RedisClient(Redis):
         await self.execute_command("PING")  # Sus
 
         if not self._pubsub_router.empty:
+            self._pubsub_router.freeze()
             await self.__create_pubsub_task()
 
         return self
@@ -73,66 +90,79 @@ class RedisClient(Redis):
     async def __listen_pubsub(
         self,
     ) -> None:
-        async with (
-            self._pubsub_listen_lock,
-            self.pubsub() as pubsub,
-        ):
-            for channel in self._pubsub_router.route_map():
-                await pubsub.subscribe(channel)
+        async with self.pubsub(ignore_subscribe_messages=True) as pubsub:
+            channels = self._pubsub_router.channels()
+            await pubsub.subscribe(*channels)
 
             logger.info(
                 "PubSub listener started.",
-                extra={"channels": list(self._pubsub_router.route_map().keys())},
+                extra={"channels": list(channels)},
             )
 
-            while True:
-                message = await pubsub.get_message()
-                if message is None:
-                    continue
+            # Hot loop: bind frequently used callables to locals.
+            get_handler = self.__handler_map().get
+            safe_handle = self.__safe_handle
+            tasks = self._tasks
+            tasks_add = tasks.add
+            tasks_discard = tasks.discard
+            create_task = asyncio.create_task
 
+            async for message in pubsub.listen():
                 if message.get("type") != "message":
                     continue
 
-                handler = self._pubsub_router._get_handler(message["channel"])
+                handler = get_handler(message["channel"])
                 if handler is None:
                     logger.warning(
                         "No handler for subscribed channel!",
                         extra={
-                            "channel": message["channel"],
+                            "channel": _channel_name(message["channel"]),
                         },
                     )
                     continue
 
-                # NOTE: Asyncio tasks can get GC'd, so we hold references in a queue.
-                if self._tasks.full():
-                    self._tasks.get_nowait()
-
-                await self._tasks.put(
-                    asyncio.create_task(
-                        self.__safe_handle(
-                            handler,
-                            message["channel"],
-                            message["data"],
-                        ),
+                # NOTE: Asyncio tasks can get GC'd, so we hold references until they finish.
+                task = create_task(
+                    safe_handle(
+                        handler,
+                        message["channel"],
+                        message["data"],
                     ),
                 )
+                tasks_add(task)
+                task.add_done_callback(tasks_discard)
+
+    def __handler_map(
+        self,
+    ) -> dict[bytes, PubSubHandler] | dict[str, PubSubHandler]:
+        """The route map keyed by channel names as they are received from Redis.
+
+        A plain dict copy is returned as the read-only route map view is slower to
+        query in the dispatch loop.
+        """
+
+        route_map = self._pubsub_router.route_map()
+        if self._decode_responses:
+            return dict(route_map)
+        return {channel.encode(): handler for channel, handler in route_map.items()}
 
     async def __safe_handle(
         self,
         handler: PubSubHandler,
-        channel: str,
-        data: str,
+        channel: bytes | str,
+        data: bytes | str,
     ) -> None:
         """Wraps handler execution with error handling to prevent individual
         handler failures from affecting other handlers or the listener."""
         try:
-            await handler(data)
+            # The payload type matches the client's `decode_responses` mode.
+            await handler(data)  # type: ignore[arg-type]
         except asyncio.CancelledError:
             raise
         except Exception:
             logger.exception(
                 "PubSub handler raised an exception.",
-                extra={"channel": channel},
+                extra={"channel": _channel_name(channel)},
             )
 
     async def __create_pubsub_task(self) -> asyncio.Task[None]:
@@ -152,6 +182,8 @@ class RedisPubsubRouter:
     __slots__ = (
         "_routes",
         "_prefix",
+        "_channels",
+        "_frozen",
     )
 
     def __init__(
@@ -161,6 +193,8 @@ class RedisPubsubRouter:
     ) -> None:
         self._routes: dict[str, PubSubHandler] = {}
         self._prefix = prefix
+        self._channels: tuple[str, ...] | None = None
+        self._frozen = False
 
     @property
     def empty(self) -> bool:
@@ -173,8 +207,10 @@ class RedisPubsubRouter:
         """Decorator for registering a new pubsub handler."""
 
         def decorator(handler: PubSubHandler) -> PubSubHandler:
+            self.__ensure_mutable()
             channel_name = self._prefix + channel
             self._routes[channel_name] = handler
+            self._channels = None
             return handler
 
         return decorator
@@ -182,6 +218,7 @@ class RedisPubsubRouter:
     def merge(self, other: Self) -> None:
         """Merges the routes of the given router into the current router."""
 
+        self.__ensure_mutable()
         for channel, handler in other.route_map().items():
             if channel in self._routes:
                 logger.warning(
@@ -192,12 +229,30 @@ class RedisPubsubRouter:
                 )
             self._routes[channel] = handler
 
-    def route_map(self) -> dict[str, PubSubHandler]:
-        return self._routes
+        self._channels = None
+
+    def freeze(self) -> None:
+        """Prevents any further routes from being registered or merged."""
+
+        self._frozen = True
+
+    def route_map(self) -> Mapping[str, PubSubHandler]:
+        return MappingProxyType(self._routes)
+
+    def channels(self) -> tuple[str, ...]:
+        """The channel names of all registered routes, cached until the routes change."""
+
+        if self._channels is None:
+            self._channels = tuple(self._routes)
+        return self._channels
 
     def _get_handler(self, channel: str) -> PubSubHandler | None:
         return self._routes.get(channel)
 
+    def __ensure_mutable(self) -> None:
+        if self._frozen:
+            raise RuntimeError("Pubsub router is frozen!")
+
 
 def default() -> RedisClient:
     """Creates a default configuration for the Redis adapter using the `settings` module.
@@ -207,8 +262,15 @@ def default() -> RedisClient:
         The connection still has to be initialised by calling `initialise()` on the returned instance.
     """
 
+    from redis.utils import HIREDIS_AVAILABLE
+
     from app import settings
 
+    if HIREDIS_AVAILABLE:
+        logger.debug("Using hiredis as the Redis response parser.")
+    else:
+        logger.debug("Using redis-py's default Python response parser.")
+
     return RedisClient(
         host=settings.REDIS_HOST,
         port=settings.REDIS_PORT,
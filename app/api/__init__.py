@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
 from collections.abc import Awaitable
 from collections.abc import Callable
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter
 from fastapi import FastAPI
@@ -14,6 +17,7 @@ from app import settings
 from app.adapters import mysql
 from app.adapters import redis
 from app.utilities import logging
+from app.utilities import loop
 
 from . import v1
 from .v1.response import ServiceInterruptionException
@@ -22,7 +26,7 @@ logger = logging.get_logger(__name__)
 
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     initialise_cors(app)
     initialise_mysql(app)
@@ -36,6 +40,29 @@ def create_app() -> FastAPI:
     return app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    loop.install_eager_task_factory()
+
+    await asyncio.gather(
+        app.state.mysql.connect(),
+        app.state.redis.initialise(),
+    )
+    logger.info(
+        "Connected to the MySQL and Redis databases.",
+    )
+
+    yield
+
+    await asyncio.gather(
+        app.state.mysql.disconnect(),
+        app.state.redis.aclose(),
+    )
+    logger.info(
+        "Disconnected from the MySQL and Redis databases.",
+    )
+
+
 def initialise_cors(app: FastAPI) -> None:
     if not settings.CORS_ALLOWED_ORIGINS:
         logger.debug("CORS not configured - no allowed origins specified.")
@@ -70,18 +97,6 @@ def initialise_mysql(app: FastAPI) -> None:
 
     app.state.mysql = database
 
-    # Lifecycle management
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        await app.state.mysql.connect()
-        logger.info(
-            "Connected to the MySQL database.",
-        )
-
-    @app.on_event("shutdown")
-    async def on_shutdown() -> None:
-        await app.state.mysql.disconnect()
-
     logger.debug(
         "Attached MySQL to the app instance.",
     )
@@ -90,21 +105,6 @@ def initialise_mysql(app: FastAPI) -> None:
 def initialise_redis(app: FastAPI) -> None:
     app.state.redis = redis.default()
 
-    # Lifecycle management
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        await app.state.redis.initialise()
-        logger.info(
-            "Connected to the Redis database.",
-        )
-
-    @app.on_event("shutdown")
-    async def on_shutdown() -> None:
-        await app.state.redis.aclose()
-        logger.info(
-            "Disconnected from the Redis database.",
-        )
-
     logger.debug(
         "Attached Redis to the app instance.",
     )
@@ -116,7 +116,7 @@ def initialise_request_tracing(app: FastAPI) -> None:
         request: Request,
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
-        request.state.uuid = str(uuid.uuid4())
+        request.state.uuid = uuid.uuid4().hex
 
         logging.add_context(
             uuid=request.state.uuid,
@@ -12,7 +12,6 @@
 
 from collections.abc import AsyncGenerator
 from typing import Annotated
-from typing import override
 
 from fastapi import Depends
 from fastapi import Request
@@ -26,36 +25,32 @@ from app.services import AbstractContext
 class HTTPContext(AbstractContext):
     """Context for read-only operations using the connection pool directly."""
 
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
-
-    @property
-    @override
-    def _mysql(self) -> ImplementsMySQL:
-        return self.request.app.state.mysql
-
-    @property
-    @override
-    def _redis(self) -> RedisClient:
-        return self.request.app.state.redis
+        self._mysql = request.app.state.mysql
+        self._redis = request.app.state.redis
+        self._redis_pipeline = self._redis.pipeline(transaction=False)
 
 
 class HTTPTransactionContext(AbstractContext):
     """Context for write operations using an explicit transaction."""
 
+    __slots__ = ()
+
     def __init__(self, mysql: ImplementsMySQL, redis: RedisClient) -> None:
-        self._mysql_conn = mysql
-        self._redis_conn = redis
+        self._mysql = mysql
+        self._redis = redis
+        self._redis_pipeline = redis.pipeline(transaction=False)
+
 
-    @property
-    @override
-    def _mysql(self) -> ImplementsMySQL:
-        return self._mysql_conn
+async def _get_context(request: Request) -> AsyncGenerator[HTTPContext, None]:
+    """Dependency that provides a context using the connection pool directly."""
+    context = HTTPContext(request)
+    yield context
 
-    @property
-    @override
-    def _redis(self) -> RedisClient:
-        return self._redis_conn
+    await context._redis_pipeline.execute()
 
 
 async def _get_transaction_context(
@@ -66,14 +61,20 @@ async def _get_transaction_context(
     redis_client: RedisClient = request.app.state.redis
 
     async with pool.transaction() as transaction:
-        yield HTTPTransactionContext(transaction, redis_client)
+        context = HTTPTransactionContext(transaction, redis_client)
+        yield context
+
+    # Only flushed once the MySQL transaction has committed.
+    await context._redis_pipeline.execute()
 
 
-RequiresContext = Annotated[HTTPContext, Depends(HTTPContext)]
+# Function scope tears the dependencies down before the response is sent, so the
+# Redis pipeline is flushed (and any failure surfaces) before the client sees it.
+RequiresContext = Annotated[HTTPContext, Depends(_get_context, scope="function")]
 """A type alias for read-only operations using the connection pool."""
 
 RequiresTransaction = Annotated[
     HTTPTransactionContext,
-    Depends(_get_transaction_context),
+    Depends(_get_transaction_context, scope="function"),
 ]
 """A type alias for write operations that require an explicit database transaction."""
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
+import orjson
+import pydantic_core
 from fastapi import status
 from fastapi.responses import Response
 from pydantic import BaseModel
@@ -12,6 +15,11 @@ from app.utilities import logging
 
 logger = logging.get_logger(__name__)
 
+# Together these match pydantic's `model_dump_json()` output for types orjson
+# lacks (e.g. Decimal), field names (not aliases) and UTC datetimes.
+_ORJSON_DEFAULT = functools.partial(pydantic_core.to_jsonable_python, by_alias=False)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
 
 class BaseResponse[T](BaseModel):
     """The base response model for all API v1 responses, in generic form."""
@@ -20,23 +28,37 @@ class BaseResponse[T](BaseModel):
     data: T
 
 
+class _JSONResponse(Response):
+    media_type = "application/json"
+
+
 class ServiceInterruptionException(Exception):
     def __init__(self, response: Response) -> None:
         self.response = response
 
 
 def create(data: Any, *, status: int = status.HTTP_200_OK) -> Response:
-    """Creates a response from the base response model and the given data,
-    following the API v1 response format."""
+    """Creates a JSON response wrapping the given data in the API v1 envelope
+    (`{"status": ..., "data": ...}`), serialised directly with orjson."""
 
-    model_json = BaseResponse(status=status, data=data).model_dump_json()
-    return Response(
-        content=model_json,
-        media_type="application/json",
+    return _JSONResponse(
+        content=_serialise(data, status=status),
         status_code=status,
     )
 
 
+def _serialise(data: Any, *, status: int) -> bytes:
+    try:
+        return orjson.dumps(
+            {"status": status, "data": data},
+            default=_ORJSON_DEFAULT,
+            option=_ORJSON_OPTIONS,
+        )
+    except orjson.JSONEncodeError:
+        # orjson rejects some values pydantic can encode (e.g. ints beyond 64 bits).
+        return BaseResponse(status=status, data=data).model_dump_json().encode()
+
+
 def unwrap[T](service_response: ServiceError.OnSuccess[T]) -> T:
     if is_error(service_response):
         logger.debug(
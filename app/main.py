@@ -5,7 +5,7 @@ from app import settings
 from app.utilities import logging
 from app.utilities import loop
 
-logging.configure_from_yaml()
+logging.configure_from_toml()
 loop.install_optimal_loop()
 
 match settings.APP_COMPONENT:
@@ -11,6 +11,7 @@ from fastapi import status
 
 from app.adapters.mysql import ImplementsMySQL
 from app.adapters.redis import RedisClient
+from app.adapters.redis import RedisPipeline
 from app.resources import ExampleRepository
 
 
@@ -27,6 +28,13 @@ class ServiceError(ABC, StrEnum, metaclass=_CombinedMeta):
     # the resolution of Self.
     # type OnSuccess[T] = T | Self
 
+    _resolved_name: str
+
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+        # Members are singletons, so the resolved name is computed once per member.
+        self._resolved_name = f"{self.service()}.{self.value}"
+
     @abstractmethod
     def service(self) -> str:
         """The prefix of the service for the error. Will resolve to `<service>.<error>`."""
@@ -39,7 +47,7 @@ class ServiceError(ABC, StrEnum, metaclass=_CombinedMeta):
 
     def resolve_name(self) -> str:
         """A name of the error involving the service name."""
-        return f"{self.service()}.{self.value}"
+        return self._resolved_name
 
 
 def is_success[V](result: ServiceError.OnSuccess[V]) -> TypeIs[V]:
@@ -52,15 +60,18 @@ def is_error[V](result: ServiceError.OnSuccess[V]) -> TypeIs[ServiceError]:
 
 class AbstractContext(ABC):
     """An abstract context class defining the context required for service functions
-    to be provided by context providers."""
+    to be provided by context providers.
 
-    @property
-    @abstractmethod
-    def _mysql(self) -> ImplementsMySQL: ...
+    Context providers assign the adapters as plain attributes in their `__init__`,
+    avoiding a property call on every access in the request hot path.
+    """
 
-    @property
-    @abstractmethod
-    def _redis(self) -> RedisClient: ...
+    __slots__ = ("_mysql", "_redis", "_redis_pipeline")
+
+    _mysql: ImplementsMySQL
+    _redis: RedisClient
+    # A pipeline for Redis writes, flushed in one round trip once the request succeeds.
+    _redis_pipeline: RedisPipeline
 
     @property
     def examples(self) -> ExampleRepository:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging.config
+import tomllib
 from collections.abc import Mapping
 from contextvars import ContextVar
 from logging import Logger as _LoggingLogger
@@ -9,8 +10,6 @@ from typing import Any
 from typing import Protocol
 from typing import TypeAlias
 
-import yaml
-
 _SysExcInfoType: TypeAlias = (
     tuple[type[BaseException], BaseException, TracebackType | None]
     | tuple[None, None, None]
@@ -23,12 +22,12 @@ _LOG_CONTEXT: ContextVar[dict[str, Any] | None] = ContextVar(
 )
 
 
-def configure_from_yaml(*, path: str | None = None) -> None:
+def configure_from_toml(*, path: str | None = None) -> None:
     if path is None:
-        path = "logging.yaml"
+        path = "logging.toml"
 
-    with open(path) as f:
-        config = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
 
     logging.config.dictConfig(config)
 
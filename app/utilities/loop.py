@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 
 from app.utilities import logging
@@ -42,3 +43,16 @@ def install_optimal_loop() -> None:
             "Falling back to the default asyncio event loop based on the OS platform.",
             extra={"platform": sys.platform},
         )
+
+
+def install_eager_task_factory() -> None:
+    """Makes tasks on the running event loop start executing eagerly, so coroutines
+    that finish without suspending skip the scheduling round trip entirely.
+
+    Note:
+        Must be called from within the running loop (e.g. the app lifespan), as
+        uvicorn creates its own loop rather than using the installed policy's.
+    """
+
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    logger.debug("Installed the eager task factory on the running event loop.")
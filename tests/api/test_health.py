@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 from httpx import AsyncClient
 
+from tests.conftest import MockMySQLAdapter
+
 
 class TestHealthEndpoint:
     """Tests for the /api/v1/health endpoint."""
@@ -52,3 +56,14 @@ class TestHealthEndpoint:
         response = await test_client.get("/api/v1/health/")
 
         assert response.headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_health_check_does_not_open_transaction(
+        self,
+        test_client: AsyncClient,
+    ) -> None:
+        """Health endpoint is read-only and should not open a MySQL transaction."""
+        with mock.patch.object(MockMySQLAdapter, "transaction") as transaction:
+            await test_client.get("/api/v1/health/")
+
+        transaction.assert_not_called()
@@ -5,7 +5,6 @@ from __future__ import annotations
 import os
 from collections.abc import AsyncGenerator
 from typing import Any
-from typing import override
 from unittest import mock
 
 import pytest
@@ -187,15 +186,23 @@ class MockRedisClient:
     async def get(self, key: str) -> Any:
         return self._data.get(key)
 
-    async def set(self, key: str, value: Any) -> None:
+    async def set(self, key: str, value: Any) -> bool:
         self._data[key] = value
+        return True
 
-    async def delete(self, key: str) -> None:
-        self._data.pop(key, None)
+    async def delete(self, key: str) -> int:
+        if key not in self._data:
+            return 0
+
+        del self._data[key]
+        return 1
 
     async def aclose(self) -> None:
         pass
 
+    def pipeline(self, transaction: bool = True) -> MockRedisPipeline:
+        return MockRedisPipeline(self)
+
     def set_data(self, key: str, value: Any) -> None:
         """Helper to preset data for testing."""
         self._data[key] = value
@@ -205,6 +212,33 @@ class MockRedisClient:
         self._data.clear()
 
 
+class MockRedisPipeline:
+    """A mock Redis pipeline that buffers writes until `execute()` is awaited."""
+
+    def __init__(self, client: MockRedisClient) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def set(self, key: str, value: Any) -> MockRedisPipeline:
+        self._commands.append(("set", (key, value)))
+        return self
+
+    def delete(self, key: str) -> MockRedisPipeline:
+        self._commands.append(("delete", (key,)))
+        return self
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        results: list[Any] = []
+        for command, args in commands:
+            match command:
+                case "set":
+                    results.append(await self._client.set(*args))
+                case "delete":
+                    results.append(await self._client.delete(*args))
+        return results
+
+
 class MockContext(AbstractContext):
     """A mock context for testing services without real database connections."""
 
@@ -213,18 +247,13 @@ class MockContext(AbstractContext):
         mysql_adapter: MockMySQLAdapter | None = None,
         redis_client: MockRedisClient | None = None,
     ) -> None:
-        self._mysql_adapter = mysql_adapter or MockMySQLAdapter()
-        self._redis_client = redis_client or MockRedisClient()
+        mock_redis_client = redis_client or MockRedisClient()
 
-    @property
-    @override
-    def _mysql(self) -> MockMySQLAdapter:  # type: ignore[override]
-        return self._mysql_adapter
-
-    @property
-    @override
-    def _redis(self) -> MockRedisClient:  # type: ignore[override]
-        return self._redis_client
+        self._mysql = mysql_adapter or MockMySQLAdapter()
+        self._redis = mock_redis_client  # type: ignore[assignment]
+        self._redis_pipeline = mock_redis_client.pipeline(  # type: ignore[assignment]
+            transaction=False,
+        )
 
 
 @pytest.fixture
@@ -2,11 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest import mock
+
 import pytest
 
 from app.adapters import redis
 
 
+class _MockPubSub:
+    """A mock pubsub connection yielding a fixed list of messages."""
+
+    def __init__(self, messages: list[dict[str, Any]]) -> None:
+        self._messages = messages
+        self.subscribed: tuple[str, ...] = ()
+
+    async def __aenter__(self) -> _MockPubSub:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def subscribe(self, *channels: str) -> None:
+        self.subscribed = channels
+
+    async def listen(self) -> AsyncGenerator[dict[str, Any], None]:
+        for message in self._messages:
+            yield message
+
+
+async def _listen_pubsub(
+    client: redis.RedisClient,
+    messages: list[dict[str, Any]],
+) -> None:
+    """Runs the client's pubsub listener over the given messages, then waits for
+    all spawned handler tasks to finish."""
+    with mock.patch.object(client, "pubsub", return_value=_MockPubSub(messages)):
+        await client._RedisClient__listen_pubsub()  # type: ignore[attr-defined]
+
+    await asyncio.gather(*client._tasks)
+
+
 class TestRedisPubsubRouter:
     """Tests for RedisPubsubRouter class."""
 
@@ -21,7 +59,7 @@ class TestRedisPubsubRouter:
         router = redis.RedisPubsubRouter()
 
         @router.register("test_channel")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         assert router.empty is False
@@ -31,7 +69,7 @@ class TestRedisPubsubRouter:
         router = redis.RedisPubsubRouter()
 
         @router.register("test_channel")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         route_map = router.route_map()
@@ -43,7 +81,7 @@ class TestRedisPubsubRouter:
         router = redis.RedisPubsubRouter(prefix="app:")
 
         @router.register("events")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         route_map = router.route_map()
@@ -55,7 +93,7 @@ class TestRedisPubsubRouter:
         router = redis.RedisPubsubRouter()
 
         @router.register("test_channel")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         result = router._get_handler("test_channel")
@@ -75,11 +113,11 @@ class TestRedisPubsubRouter:
         router2 = redis.RedisPubsubRouter()
 
         @router1.register("channel1")
-        async def handler1(data: str) -> None:
+        async def handler1(data: bytes) -> None:
             pass
 
         @router2.register("channel2")
-        async def handler2(data: str) -> None:
+        async def handler2(data: bytes) -> None:
             pass
 
         router1.merge(router2)
@@ -94,11 +132,11 @@ class TestRedisPubsubRouter:
         router2 = redis.RedisPubsubRouter()
 
         @router1.register("shared_channel")
-        async def handler1(data: str) -> None:
+        async def handler1(data: bytes) -> None:
             pass
 
         @router2.register("shared_channel")
-        async def handler2(data: str) -> None:
+        async def handler2(data: bytes) -> None:
             pass
 
         router1.merge(router2)
@@ -106,6 +144,74 @@ class TestRedisPubsubRouter:
         route_map = router1.route_map()
         assert route_map["shared_channel"] is handler2
 
+    def test_channels_returns_registered_channel_names(self) -> None:
+        """channels should return the names of all registered channels."""
+        router = redis.RedisPubsubRouter(prefix="app:")
+
+        @router.register("events")
+        async def handler(data: bytes) -> None:
+            pass
+
+        assert router.channels() == ("app:events",)
+
+    def test_channels_is_invalidated_on_register(self) -> None:
+        """channels should reflect handlers registered after a previous call."""
+        router = redis.RedisPubsubRouter()
+
+        @router.register("channel1")
+        async def handler1(data: bytes) -> None:
+            pass
+
+        assert router.channels() == ("channel1",)
+
+        @router.register("channel2")
+        async def handler2(data: bytes) -> None:
+            pass
+
+        assert router.channels() == ("channel1", "channel2")
+
+    def test_channels_is_invalidated_on_merge(self) -> None:
+        """channels should reflect routes merged after a previous call."""
+        router1 = redis.RedisPubsubRouter()
+        router2 = redis.RedisPubsubRouter()
+
+        @router2.register("channel2")
+        async def handler2(data: bytes) -> None:
+            pass
+
+        assert router1.channels() == ()
+
+        router1.merge(router2)
+
+        assert router1.channels() == ("channel2",)
+
+    def test_route_map_is_read_only(self) -> None:
+        """route_map should not allow routes to be mutated directly."""
+        router = redis.RedisPubsubRouter()
+
+        with pytest.raises(TypeError):
+            router.route_map()["test_channel"] = lambda data: None  # type: ignore
+
+    def test_register_raises_after_freeze(self) -> None:
+        """register should raise once the router has been frozen."""
+        router = redis.RedisPubsubRouter()
+        router.freeze()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+
+            @router.register("test_channel")
+            async def handler(data: bytes) -> None:
+                pass
+
+    def test_merge_raises_after_freeze(self) -> None:
+        """merge should raise once the router has been frozen."""
+        router1 = redis.RedisPubsubRouter()
+        router2 = redis.RedisPubsubRouter()
+        router1.freeze()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            router1.merge(router2)
+
 
 class TestRedisClientRegistration:
     """Tests for RedisClient handler registration."""
@@ -129,7 +235,7 @@ class TestRedisClientRegistration:
         )
 
         @client.register("test_channel")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         route_map = client._pubsub_router.route_map()
@@ -145,7 +251,7 @@ class TestRedisClientRegistration:
         router = redis.RedisPubsubRouter()
 
         @router.register("external_channel")
-        async def handler(data: str) -> None:
+        async def handler(data: bytes) -> None:
             pass
 
         client.include_router(router)
@@ -179,3 +285,74 @@ class TestRedisClientRegistration:
 
         with pytest.raises(RuntimeError, match="already created"):
             client.include_router(router)
+
+
+class TestRedisClientPubsubDispatch:
+    """Tests for RedisClient pubsub message dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_bytes_channel_to_handler(self) -> None:
+        """Messages with bytes channels should reach the handler registered for them."""
+        client = redis.RedisClient(
+            host="localhost",
+            port=6379,
+            database=0,
+        )
+        received: list[bytes] = []
+
+        @client.register("app:events")
+        async def handler(data: bytes) -> None:
+            received.append(data)
+
+        await _listen_pubsub(
+            client,
+            [{"type": "message", "channel": b"app:events", "data": b"payload"}],
+        )
+
+        assert received == [b"payload"]
+
+    @pytest.mark.asyncio
+    async def test_dispatches_str_channel_when_decoding_responses(self) -> None:
+        """With decode_responses, str channels should reach their handler."""
+        client = redis.RedisClient(
+            host="localhost",
+            port=6379,
+            database=0,
+            decode_responses=True,
+        )
+        received: list[str] = []
+
+        @client.register("app:events")
+        async def handler(data: str) -> None:
+            received.append(data)
+
+        await _listen_pubsub(
+            client,
+            [{"type": "message", "channel": "app:events", "data": "payload"}],
+        )
+
+        assert received == ["payload"]
+
+    @pytest.mark.asyncio
+    async def test_logs_unhandled_bytes_channel_as_str(self) -> None:
+        """Unhandled bytes channels should be logged as readable strings."""
+        client = redis.RedisClient(
+            host="localhost",
+            port=6379,
+            database=0,
+        )
+
+        @client.register("app:events")
+        async def handler(data: bytes) -> None:
+            pass
+
+        with mock.patch.object(redis, "logger") as logger:
+            await _listen_pubsub(
+                client,
+                [{"type": "message", "channel": b"app:other", "data": b"payload"}],
+            )
+
+        logger.warning.assert_called_once_with(
+            "No handler for subscribed channel!",
+            extra={"channel": "app:other"},
+        )
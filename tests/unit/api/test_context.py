@@ -0,0 +1,101 @@
+"""Unit tests for the API v1 context dependencies."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi import Response
+from fastapi import status
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from app import api
+from app.api.v1 import response
+from app.api.v1.context import RequiresContext
+from app.api.v1.context import RequiresTransaction
+from tests.conftest import MockMySQLAdapter
+from tests.conftest import MockRedisClient
+
+
+def _create_app(redis_client: MockRedisClient) -> FastAPI:
+    app = FastAPI()
+    app.state.mysql = MockMySQLAdapter()
+    app.state.redis = redis_client
+    api.initialise_interruptions(app)
+
+    @app.post("/context")
+    async def write_with_context(ctx: RequiresContext) -> Response:
+        ctx._redis_pipeline.set("key", "value")
+        return response.create(None)
+
+    @app.post("/context/error")
+    async def write_with_context_error(ctx: RequiresContext) -> Response:
+        ctx._redis_pipeline.set("key", "value")
+        raise response.ServiceInterruptionException(
+            response.create(None, status=status.HTTP_400_BAD_REQUEST),
+        )
+
+    @app.post("/transaction")
+    async def write_with_transaction(ctx: RequiresTransaction) -> Response:
+        ctx._redis_pipeline.set("key", "value")
+        return response.create(None)
+
+    @app.post("/transaction/error")
+    async def write_with_transaction_error(ctx: RequiresTransaction) -> Response:
+        ctx._redis_pipeline.set("key", "value")
+        raise response.ServiceInterruptionException(
+            response.create(None, status=status.HTTP_400_BAD_REQUEST),
+        )
+
+    return app
+
+
+@pytest.fixture
+def redis_client() -> MockRedisClient:
+    return MockRedisClient()
+
+
+@pytest_asyncio.fixture
+async def client(
+    redis_client: MockRedisClient,
+) -> AsyncGenerator[AsyncClient, None]:
+    async with AsyncClient(
+        transport=ASGITransport(app=_create_app(redis_client)),  # type: ignore[arg-type]
+        base_url="http://test",
+    ) as client:
+        yield client
+
+
+class TestRedisPipelineFlushing:
+    """Tests for flushing the per-request Redis pipeline."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/context", "/transaction"])
+    async def test_queued_writes_are_flushed_on_success(
+        self,
+        client: AsyncClient,
+        redis_client: MockRedisClient,
+        path: str,
+    ) -> None:
+        """Queued writes should be executed once the handler succeeds."""
+        result = await client.post(path)
+
+        assert result.status_code == status.HTTP_200_OK
+        assert await redis_client.get("key") == "value"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/context/error", "/transaction/error"])
+    async def test_queued_writes_are_dropped_on_service_error(
+        self,
+        client: AsyncClient,
+        redis_client: MockRedisClient,
+        path: str,
+    ) -> None:
+        """Queued writes should be discarded when the handler is interrupted."""
+        result = await client.post(path)
+
+        assert result.status_code == status.HTTP_400_BAD_REQUEST
+        assert await redis_client.get("key") is None
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
 from typing import override
 
+import pydantic_core
 import pytest
 from fastapi import status
+from pydantic import BaseModel
+from pydantic import Field
 
 from app.api.v1 import response
 from app.services._common import ServiceError
@@ -26,6 +33,18 @@ class _MockError(ServiceError):
         return status.HTTP_400_BAD_REQUEST
 
 
+class _MockModel(BaseModel):
+    """Mock model for response serialisation tests."""
+
+    id: int
+
+
+class _MockAliasedModel(BaseModel):
+    """Mock model with an aliased field for response serialisation tests."""
+
+    user_id: int = Field(alias="userId")
+
+
 class TestCreate:
     """Tests for response.create function."""
 
@@ -71,6 +90,60 @@ class TestCreate:
         body = json.loads(bytes(result.body))
         assert body["data"] is None
 
+    def test_serialises_pydantic_models(self) -> None:
+        """create should serialise pydantic models, including nested ones."""
+        result = response.create([_MockModel(id=1), _MockModel(id=2)])
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == [{"id": 1}, {"id": 2}]
+
+    def test_serialises_field_names_instead_of_aliases(self) -> None:
+        """create should serialise models by field name, not alias."""
+        result = response.create(_MockAliasedModel(userId=1))
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"user_id": 1}
+
+    def test_serialises_utc_datetime_with_z_suffix(self) -> None:
+        """create should serialise UTC datetimes with a `Z` suffix, like pydantic."""
+        result = response.create({"at": datetime(2024, 1, 1, tzinfo=UTC)})
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"at": "2024-01-01T00:00:00Z"}
+
+    def test_serialises_integers_beyond_64_bits(self) -> None:
+        """create should serialise integers that do not fit in 64 bits."""
+        result = response.create({"value": 2**70})
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"value": 2**70}
+
+    def test_serialises_decimal(self) -> None:
+        """create should serialise Decimal values (e.g. DECIMAL columns) as strings."""
+        result = response.create({"price": Decimal("1.50")})
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"price": "1.50"}
+
+    def test_serialises_timedelta(self) -> None:
+        """create should serialise timedelta values (e.g. TIME columns) as ISO 8601."""
+        result = response.create({"duration": timedelta(seconds=5)})
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"duration": "PT5S"}
+
+    def test_serialises_non_string_keys(self) -> None:
+        """create should serialise dicts with non-string keys."""
+        result = response.create({1: "a"})
+
+        body = json.loads(bytes(result.body))
+        assert body["data"] == {"1": "a"}
+
+    def test_raises_for_unserialisable_data(self) -> None:
+        """create should raise for data that cannot be serialised to JSON."""
+        with pytest.raises(pydantic_core.PydanticSerializationError):
+            response.create(object())
+
 
 class TestUnwrap:
     """Tests for response.unwrap function."""
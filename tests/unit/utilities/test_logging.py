@@ -3,13 +3,31 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from pathlib import Path
 from typing import Any
+from unittest import mock
 
 import pytest
 
 from app.utilities import logging
 
 
+class TestConfigureFromToml:
+    """Tests for configure_from_toml function."""
+
+    def test_applies_config_from_file(self, tmp_path: Path) -> None:
+        """configure_from_toml should pass the parsed TOML file to dictConfig."""
+        config_path = tmp_path / "logging.toml"
+        config_path.write_text(
+            'version = 1\n\n[root]\nlevel = "INFO"\n',
+        )
+
+        with mock.patch.object(logging.logging.config, "dictConfig") as dict_config:
+            logging.configure_from_toml(path=str(config_path))
+
+        dict_config.assert_called_once_with({"version": 1, "root": {"level": "INFO"}})
+
+
 class TestLoggingContext:
     """Tests for logging context management."""
 
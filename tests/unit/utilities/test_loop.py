@@ -0,0 +1,26 @@
+"""Unit tests for event loop utilities."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.utilities import loop
+
+
+class TestInstallEagerTaskFactory:
+    """Tests for install_eager_task_factory function."""
+
+    @pytest.mark.asyncio
+    async def test_sets_eager_task_factory_on_running_loop(self) -> None:
+        """The running loop should use the eager task factory once installed."""
+        running_loop = asyncio.get_running_loop()
+        original_factory = running_loop.get_task_factory()
+
+        try:
+            loop.install_eager_task_factory()
+
+            assert running_loop.get_task_factory() is asyncio.eager_task_factory
+        finally:
+            running_loop.set_task_factory(original_factory)